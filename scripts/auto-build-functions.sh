@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# shellcheck source=scripts/builder-vars.sh
+. "$(dirname "${BASH_SOURCE[0]}")/builder-vars.sh"
+
 build_failure() {
     local component=$1
     local package_set=$2
@@ -10,9 +13,9 @@ build_failure() {
     # don't let the API key be logged...
     local GITHUB_API_KEY
     local GITHUB_BUILD_ISSUES_REPO
-    RELEASE=$(make -s get-var GET_VAR=RELEASE)
-    GITHUB_API_KEY=$(make -s get-var GET_VAR=GITHUB_API_KEY)
-    GITHUB_BUILD_ISSUES_REPO=$(make -s get-var GET_VAR=GITHUB_BUILD_ISSUES_REPO)
+    RELEASE=$(builder_var RELEASE)
+    GITHUB_API_KEY=$(builder_var GITHUB_API_KEY)
+    GITHUB_BUILD_ISSUES_REPO=$(builder_var GITHUB_BUILD_ISSUES_REPO)
     echo "Build failed: $component for $package_set (r$RELEASE $dist)" >&2
     if [ -z "$GITHUB_API_KEY" ] || [ -z "$GITHUB_BUILD_ISSUES_REPO" ]; then
         echo "No alternative way of build failure reporting (GITHUB_API_KEY, GITHUB_BUILD_ISSUES_REPO), exiting" >&2
@@ -27,7 +30,7 @@ build_failure() {
 get_build_log_url() {
     local log_name
     log_name=$(cat "$log_service_output_file" 2>/dev/null || :)
-    GITHUB_LOGS_REPO=$(make -s get-var GET_VAR=GITHUB_LOGS_REPO)
+    GITHUB_LOGS_REPO=$(builder_var GITHUB_LOGS_REPO)
     if [ -z "$log_name" ]; then
         echo "https://github.com/${GITHUB_LOGS_REPO:-QubesOS/build-logs}/tree/master/$(hostname)"
     else
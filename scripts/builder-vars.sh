@@ -0,0 +1,34 @@
+#!/bin/bash
+
+# Access to builder configuration variables, evaluated once per script
+# instead of one `make get-var` call per variable (and only when the
+# configuration changed, see scripts/dump-vars --cached).
+#
+#  - load_builder_vars - (re)load all variables
+#  - builder_var NAME - print value of NAME, like `make -s get-var GET_VAR=NAME`
+#
+# Call load_builder_vars before builder_var is used in a command substitution
+# ($(builder_var ...) runs in a subshell, which would load them each time).
+
+declare -gA BUILDER_VARS
+BUILDER_VARS_SCRIPT_DIR="$(dirname "$(readlink -f "${BASH_SOURCE[0]}")")"
+BUILDER_VARS_LOADED=
+
+load_builder_vars() {
+    local dump
+    BUILDER_VARS=()
+    dump=$("$BUILDER_VARS_SCRIPT_DIR/dump-vars" --cached --format shell \
+            --array BUILDER_VARS) || return 1
+    eval "$dump"
+    BUILDER_VARS_LOADED=1
+}
+
+builder_var() {
+    [ -n "$BUILDER_VARS_LOADED" ] || load_builder_vars || return 1
+    if [ -n "${BUILDER_VARS[$1]+x}" ]; then
+        echo "${BUILDER_VARS[$1]}"
+    else
+        # not defined by the configuration, but inherited from environment
+        printenv "$1" || :
+    fi
+}